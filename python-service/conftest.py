@@ -0,0 +1,38 @@
+"""
+Shared pytest configuration for the Resume Intelligence Engine tests
+
+Tests are independent and can run in parallel with pytest-xdist
+(`pytest -n auto`); session-scoped fixtures are then created once per worker.
+"""
+import os
+
+import pytest
+from hypothesis import settings
+
+from no_show_risk_analyzer import _score_core
+from resume_ranker import EnhancedResumeRanker
+
+# Hypothesis profiles: "ci" keeps the round-trip property cheap on every run,
+# "nightly" explores far more inputs. Select with HYPOTHESIS_PROFILE=nightly.
+settings.register_profile("ci", max_examples=5, deadline=None)
+settings.register_profile("nightly", max_examples=200, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "integration: test talks to a real Postgres database (run in CI only)"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_score_core():
+    """Compile the (optionally Numba-jitted) risk scoring core before any test runs"""
+    _score_core(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+@pytest.fixture(scope="session")
+def ranker():
+    """Shared EnhancedResumeRanker instance (one per worker under pytest-xdist)"""
+    return EnhancedResumeRanker()
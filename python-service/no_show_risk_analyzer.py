@@ -9,9 +9,33 @@ from datetime import datetime
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the scoring core then runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _score_core(response_risk, negotiation_risk, profile_risk, historical_risk,
+                response_weight, negotiation_weight, profile_weight, historical_weight):
+    """
+    Weighted total of the four risk factor scores.
+    
+    Kept free of dicts and objects so Numba can compile it when installed.
+    """
+    return (
+        response_risk * response_weight +
+        negotiation_risk * negotiation_weight +
+        profile_risk * profile_weight +
+        historical_risk * historical_weight
+    )
+
+
 class NoShowRiskAnalyzer:
     """
     Analyzes candidate behavior patterns to predict interview no-show risk.
@@ -38,13 +62,15 @@ class NoShowRiskAnalyzer:
             'historical_pattern': 0.25
         }
     
-    def analyze_risk(self, interview_id: str, candidate_id: str) -> Dict:
+    def analyze_risk(self, interview_id: str, candidate_id: str, *, cursor=None) -> Dict:
         """
         Analyze no-show risk for a candidate's interview.
         
         Args:
             interview_id: UUID of the interview
             candidate_id: UUID of the candidate
+            cursor: Optional dict-row cursor to read from. When given, the
+                caller owns it and no connection is opened or closed here.
             
         Returns:
             Dictionary with:
@@ -52,10 +78,12 @@ class NoShowRiskAnalyzer:
             - risk_level: str ('low', 'medium', 'high')
             - factors: dict with individual risk factor scores
         """
+        conn = None
         try:
-            # Get database connection
-            conn = self._get_db_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            # Get database connection unless a cursor was supplied
+            if cursor is None:
+                conn = self._get_db_connection()
+                cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             # Fetch interview data
             interview = self._get_interview(cursor, interview_id)
@@ -79,16 +107,19 @@ class NoShowRiskAnalyzer:
             historical_risk = self._calculate_historical_risk(cursor, candidate_id)
             
             # Compute weighted total risk
-            total_risk = (
-                response_risk * self.weights['response_time'] +
-                negotiation_risk * self.weights['negotiation_complexity'] +
-                profile_risk * self.weights['profile_completeness'] +
-                historical_risk * self.weights['historical_pattern']
+            total_risk = _score_core(
+                float(response_risk), float(negotiation_risk),
+                float(profile_risk), float(historical_risk),
+                self.weights['response_time'],
+                self.weights['negotiation_complexity'],
+                self.weights['profile_completeness'],
+                self.weights['historical_pattern']
             )
             
-            # Close database connection
-            cursor.close()
-            conn.close()
+            # Close database connection if we opened it
+            if conn is not None:
+                cursor.close()
+                conn.close()
             
             # Calculate response time in hours for reporting
             response_time_hours = self._get_response_time_hours(interview)
@@ -0,0 +1,90 @@
+"""
+Shared scenario rows and DB stubs for the no-show risk analyzer tests
+"""
+from datetime import datetime, timedelta
+
+# Fixed reference time shared by the risk analyzer property tests, so memoized
+# scenarios stay consistent, plus the timestamps every scenario reuses
+NOW = datetime.now()
+D30 = NOW - timedelta(days=30)
+D5 = NOW - timedelta(days=5)
+H1 = NOW - timedelta(hours=1)
+
+# Fields that never vary between risk scenarios; each scenario copies a
+# template and overrides only its own status/timestamps/profile fields
+INTERVIEW_TEMPLATE = {
+    'id': 'test-interview-id',
+    'application_id': 'test-app-id',
+    'job_id': 'test-job-id',
+    'recruiter_id': 'test-recruiter-id',
+    'candidate_id': 'test-candidate-id',
+    'confirmation_deadline': None,
+    'slot_selection_deadline': None,
+    'scheduled_time': None
+}
+
+CANDIDATE_TEMPLATE = {
+    'id': 'test-candidate-id',
+    'created_at': D30
+}
+
+APPLICATION_TEMPLATE = {
+    'id': 'test-app-id',
+    'applicant_id': 'test-candidate-id',
+    'job_id': 'test-job-id',
+    'created_at': D5
+}
+
+# The only past interview rows the scenarios need. The analyzer only reads
+# the 'status' field, so every history repeats these shared dicts.
+COMPLETED = {'status': 'completed'}
+NO_SHOW = {'status': 'no_show'}
+CANCELLED = {'status': 'cancelled'}
+
+
+class FakeCursor:
+    """
+    Minimal DB cursor stub returning canned fetchone/fetchall results.
+    
+    fetchone is the bound __next__ of an iterator over the canned rows, so
+    each call is a single C-level step. load() swaps in new rows, letting one
+    cursor be reused across Hypothesis examples.
+    """
+    __slots__ = ('fetchone', '_fa')
+    
+    def __init__(self, fo=(), fa=()):
+        self.load(fo, fa)
+    
+    def load(self, fo, fa):
+        """Replace the canned fetchone rows and fetchall result"""
+        self.fetchone = iter(fo).__next__
+        self._fa = fa
+    
+    def fetchall(self):
+        return self._fa
+    
+    def execute(self, *args, **kwargs):
+        pass
+    
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        pass
+
+
+class FakeConn:
+    """Minimal DB connection stub handing out a single FakeCursor"""
+    __slots__ = ('c',)
+    
+    def __init__(self, c):
+        self.c = c
+    
+    def cursor(self, *args, **kwargs):
+        return self.c
+    
+    def close(self):
+        pass
@@ -238,6 +238,32 @@ class TestNoShowRiskAnalyzer:
         # Verify database connection was closed
         mock_cursor.close.assert_called_once()
         mock_conn.close.assert_called_once()
+    
+    @patch('no_show_risk_analyzer.NoShowRiskAnalyzer._get_db_connection')
+    def test_analyze_risk_with_injected_cursor(self, mock_db_conn):
+        """Test that an injected cursor is used as-is and left open"""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.side_effect = [
+            {
+                'id': 'interview-123',
+                'application_id': 'app-123',
+                'status': 'slot_pending',
+                'created_at': datetime.now() - timedelta(hours=3),
+                'updated_at': datetime.now()
+            },
+            {'id': 'candidate-123', 'name': 'John Doe', 'email': 'john@example.com', 'phone': None},
+            {'id': 'app-123', 'cover_letter': None, 'address': None, 'resume_url': None},
+            None  # No negotiation
+        ]
+        mock_cursor.fetchall.return_value = []
+        
+        result = self.analyzer.analyze_risk('interview-123', 'candidate-123', cursor=mock_cursor)
+        
+        assert 0.0 <= result['no_show_risk'] <= 1.0
+        
+        # The caller owns the cursor: no connection opened, nothing closed
+        mock_db_conn.assert_not_called()
+        mock_cursor.close.assert_not_called()
 
 
 if __name__ == '__main__':
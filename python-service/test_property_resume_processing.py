@@ -8,37 +8,42 @@ For any application submission with a valid resume PDF, processing the resume an
 storing the results should allow retrieval of fit_score, extracted features, and 
 summary from the database, with ai_processed flag set to true.
 """
+import itertools
 import os
-import sys
+import time
 import uuid
 import psycopg2
-from hypothesis import given, settings, strategies as st, assume, HealthCheck
+import pytest
+from functools import lru_cache
+from unittest.mock import MagicMock
+from hypothesis import given, settings, strategies as st, target, HealthCheck
+from hypothesis.control import currently_in_test_context
 from hypothesis.strategies import composite
 from io import BytesIO
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 import tempfile
+import textwrap
 import logging
 
-from resume_ranker import EnhancedResumeRanker
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database connection helper
-def get_db_connection():
-    """Get database connection from environment variables"""
-    # Try to load from .env file if available
+# Load database settings from .env files once, unless already configured
+if not os.getenv('DATABASE_URL'):
     try:
         from dotenv import load_dotenv
         # Try loading from python-service directory
         load_dotenv()
         # Also try loading from backend config
         load_dotenv('../backend/config/config.env')
-    except:
+    except ImportError:
         pass
-    
+
+# Database connection helper
+def get_db_connection():
+    """Get database connection from environment variables"""
     # Get connection string from environment
     db_url = os.getenv('DATABASE_URL')
     if db_url:
@@ -71,44 +76,36 @@ def get_db_connection():
         password=os.getenv('DB_PASSWORD', '')
     )
 
-# Strategy for generating resume content
-@composite
-def resume_content(draw):
-    """Generate realistic resume content for testing"""
-    # Generate candidate name
-    first_names = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Lisa']
-    last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis']
-    name = f"{draw(st.sampled_from(first_names))} {draw(st.sampled_from(last_names))}"
-    
-    # Generate job title
-    titles = ['Software Engineer', 'Senior Developer', 'Data Scientist', 'Full Stack Developer', 
-              'Backend Engineer', 'Frontend Developer', 'DevOps Engineer', 'ML Engineer']
-    title = draw(st.sampled_from(titles))
+# Resume building blocks
+FIRST_NAMES = ['John', 'Jane', 'Michael', 'Sarah', 'David', 'Emily', 'Robert', 'Lisa']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis']
+TITLES = ['Software Engineer', 'Senior Developer', 'Data Scientist', 'Full Stack Developer', 
+          'Backend Engineer', 'Frontend Developer', 'DevOps Engineer', 'ML Engineer']
+ALL_SKILLS = ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 'Kubernetes',
+              'PostgreSQL', 'MongoDB', 'TypeScript', 'Django', 'Flask', 'Express',
+              'Machine Learning', 'Data Science', 'CI/CD', 'Git', 'REST API']
+EDUCATION_LEVELS = [
+    'Bachelor of Science in Computer Science',
+    'Master of Science in Computer Science',
+    'Bachelor of Engineering',
+    'Master of Engineering',
+    'PhD in Computer Science'
+]
+PROJECT_TYPES = ['Web Application', 'Mobile App', 'API Service', 'Data Pipeline', 
+                 'Analytics Dashboard', 'E-commerce Platform', 'Chat Application']
+YEARS_EXPERIENCE = [1, 3, 5, 8, 12, 15]
+
+# Skill sets of 3-10 skills, each starting at a different offset into ALL_SKILLS
+SKILL_SETS = [
+    (ALL_SKILLS[offset:] + ALL_SKILLS[:offset])[:size]
+    for offset, size in zip(range(0, 16, 2), range(3, 11))
+]
+
+def format_resume(index, title, education, years_exp, skills):
+    """Render one resume body; name, project count and project types cycle with index"""
+    name = f"{FIRST_NAMES[index % 8]} {LAST_NAMES[index // 8 % 8]}"
+    project_count = 3 + index % 18  # 3-20 projects
     
-    # Generate years of experience (1-15 years)
-    years_exp = draw(st.integers(min_value=1, max_value=15))
-    
-    # Generate skills
-    all_skills = ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 'Kubernetes',
-                  'PostgreSQL', 'MongoDB', 'TypeScript', 'Django', 'Flask', 'Express',
-                  'Machine Learning', 'Data Science', 'CI/CD', 'Git', 'REST API']
-    num_skills = draw(st.integers(min_value=3, max_value=10))
-    skills = draw(st.lists(st.sampled_from(all_skills), min_size=num_skills, max_size=num_skills, unique=True))
-    
-    # Generate education
-    education_levels = [
-        'Bachelor of Science in Computer Science',
-        'Master of Science in Computer Science',
-        'Bachelor of Engineering',
-        'Master of Engineering',
-        'PhD in Computer Science'
-    ]
-    education = draw(st.sampled_from(education_levels))
-    
-    # Generate project count (3-20 projects)
-    project_count = draw(st.integers(min_value=3, max_value=20))
-    
-    # Build resume text
     resume_text = f"""
 {name}
 {title}
@@ -136,17 +133,32 @@ Projects:
 """
     
     # Add project descriptions
-    project_types = ['Web Application', 'Mobile App', 'API Service', 'Data Pipeline', 
-                     'Analytics Dashboard', 'E-commerce Platform', 'Chat Application']
     for i in range(min(5, project_count)):
-        project_type = draw(st.sampled_from(project_types))
+        project_type = PROJECT_TYPES[(index + i) % len(PROJECT_TYPES)]
         resume_text += f"- {project_type}: Built scalable system with modern technologies\n"
     
     return resume_text
 
+# Every resume body is rendered once at import (8 titles x 5 degrees x 6 years x 8 skill sets)
+_RESUME_BODIES = [
+    format_resume(index, title, education, years_exp, skills)
+    for index, (title, education, years_exp, skills) in enumerate(
+        itertools.product(TITLES, EDUCATION_LEVELS, YEARS_EXPERIENCE, SKILL_SETS)
+    )
+]
+
+# Every pooled resume is long enough to be a valid input
+assert min(len(body.strip()) for body in _RESUME_BODIES) >= 100
+
+# Strategy for generating resume content
+@composite
+def resume_content(draw):
+    """Pick a realistic pre-rendered resume for testing"""
+    return _RESUME_BODIES[draw(st.integers(min_value=0, max_value=len(_RESUME_BODIES) - 1))]
+
 @composite
 def job_description_content(draw):
-    """Generate realistic job description for testing"""
+    """Generate realistic job description for testing (always well over 50 characters)"""
     titles = ['Software Engineer', 'Senior Developer', 'Full Stack Developer', 'Backend Engineer']
     title = draw(st.sampled_from(titles))
     
@@ -177,41 +189,26 @@ Qualifications:
 """
     return job_desc
 
+# Lines that fit between y=750 and the y=50 bottom margin at 12pt leading
+PDF_LINES_PER_PAGE = 58
+
 def create_pdf_from_text(text: str) -> bytes:
     """Create a PDF file from text content"""
     buffer = BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
     
-    # Set up text object
-    text_object = c.beginText(50, 750)
-    text_object.setFont("Helvetica", 10)
-    
-    # Split text into lines and add to PDF
-    lines = text.split('\n')
-    for line in lines:
-        # Handle long lines
-        if len(line) > 80:
-            words = line.split()
-            current_line = ""
-            for word in words:
-                if len(current_line + word) < 80:
-                    current_line += word + " "
-                else:
-                    text_object.textLine(current_line.strip())
-                    current_line = word + " "
-            if current_line:
-                text_object.textLine(current_line.strip())
-        else:
-            text_object.textLine(line)
-        
-        # Check if we need a new page
-        if text_object.getY() < 50:
-            c.drawText(text_object)
+    # Wrap long lines at 80 characters up front, preserving the line breaks
+    lines = '\n'.join(textwrap.fill(line, width=80) for line in text.split('\n')).split('\n')
+    
+    # Emit one page worth of lines at a time
+    for start in range(0, len(lines), PDF_LINES_PER_PAGE):
+        if start:
             c.showPage()
-            text_object = c.beginText(50, 750)
-            text_object.setFont("Helvetica", 10)
+        text_object = c.beginText(50, 750)
+        text_object.setFont("Helvetica", 10)
+        text_object.textLines(lines[start:start + PDF_LINES_PER_PAGE])
+        c.drawText(text_object)
     
-    c.drawText(text_object)
     c.save()
     
     buffer.seek(0)
@@ -247,17 +244,133 @@ def setup_test_database():
         logger.error(f"Database setup error: {str(e)}")
         return False
 
+def _random_uuids(count):
+    """Generate count random UUID4 strings from a single os.urandom call"""
+    buf = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+INSERT_APPLICATION_SQL = """
+    INSERT INTO applications (
+        id, job_id, applicant_id, fit_score, summary, 
+        shortlist_status, ai_processed
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (id) DO UPDATE SET
+        fit_score = EXCLUDED.fit_score,
+        summary = EXCLUDED.summary,
+        ai_processed = EXCLUDED.ai_processed
+"""
+
+def _persist_and_fetch(conn, application_id, result, job_id, applicant_id):
+    """
+    Store a processed result in the applications table and read it back.
+    
+    job_id and applicant_id are dummy foreign keys for the inserted row.
+    Returns the (fit_score, summary, ai_processed) row as seen by the database.
+    The insert is never committed: the SELECT reads it back inside the same
+    transaction, which is then rolled back instead of deleting the row.
+    """
+    cursor = conn.cursor()
+    try:
+        # Insert application record (simulating what the backend would do).
+        # Parameters are bound client-side once via mogrify, so execute()
+        # sends the finished statement without a second adaptation pass.
+        cursor.execute(cursor.mogrify(INSERT_APPLICATION_SQL, (
+            application_id,
+            job_id,
+            applicant_id,
+            result['fit_score'],
+            result['summary'],
+            'pending',
+            True  # ai_processed flag
+        )))
+        
+        # Retrieve from database to verify round trip
+        cursor.execute("""
+            SELECT fit_score, summary, ai_processed
+            FROM applications
+            WHERE id = %s
+        """, (application_id,))
+        
+        return cursor.fetchone()
+    finally:
+        # Discard the uncommitted test row
+        conn.rollback()
+        cursor.close()
+
+def _mock_db_connection():
+    """
+    Build a MagicMock connection whose cursor echoes back the last inserted
+    fit_score, summary and ai_processed values on fetchone().
+    """
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    inserted = {}
+    
+    def mogrify(sql, params):
+        if sql is INSERT_APPLICATION_SQL:
+            inserted['row'] = (params[3], params[4], params[6])
+        return sql
+    
+    cursor.mogrify.side_effect = mogrify
+    cursor.fetchone.side_effect = lambda: inserted.get('row')
+    return conn
+
+# Hypothesis replays identical resumes while shrinking; reuse the extraction
+# and summary results for them. Fit scores depend on the job description too,
+# so they are always recomputed.
+@lru_cache(maxsize=512)
+def _cached_features(ranker, resume_text):
+    return ranker._extract_features(resume_text)
+
+@lru_cache(maxsize=512)
+def _cached_summary(ranker, resume_text):
+    return ranker.generate_summary(resume_text, max_length=200)
+
+def _process_resume(ranker, resume_text, job_desc):
+    """Run the core ranker pipeline (simulating what process_application returns)"""
+    # Instead of using process_application which expects a URL,
+    # we'll directly test the core functionality
+    features = _cached_features(ranker, resume_text)
+    summary = _cached_summary(ranker, resume_text)
+    
+    # Steer Hypothesis towards inputs that make fit scoring slow
+    start_ns = time.perf_counter_ns()
+    fit_score = ranker._compute_fit_score(resume_text, job_desc, features)
+    if currently_in_test_context():
+        target(time.perf_counter_ns() - start_ns, label="fit_score_ns")
+    
+    return {
+        'success': True,
+        'fit_score': round(fit_score, 2),
+        'summary': summary,
+        'extracted_features': features
+    }
+
+def _assert_round_trip(row, result):
+    """Verify a persisted row matches the processed result"""
+    assert row is not None, "Application should be retrievable from database"
+    
+    db_fit_score, db_summary, db_ai_processed = row
+    
+    # Verify retrieved data matches processed data. fit_score is a FLOAT
+    # (double precision) column, which stores Python floats exactly.
+    assert db_fit_score == result['fit_score'], \
+        f"Retrieved fit_score {db_fit_score} should match processed {result['fit_score']}"
+    assert db_summary == result['summary'], "Retrieved summary should match processed summary"
+    assert db_ai_processed is True, "ai_processed flag should be True"
+
 # Property Test: Resume Processing Round Trip
 @given(
     resume_text=resume_content(),
     job_desc=job_description_content()
 )
 @settings(
-    max_examples=5,  # Run 5 iterations for faster testing
+    # max_examples comes from the active profile (see conftest.py)
     deadline=None,  # Disable deadline for PDF generation
     suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow]
 )
-def test_resume_processing_round_trip(resume_text, job_desc):
+def test_resume_processing_round_trip(ranker, resume_text, job_desc):
     """
     **Validates: Requirements 1.1, 1.5, 1.6**
     
@@ -272,176 +385,103 @@ def test_resume_processing_round_trip(resume_text, job_desc):
     3. Summary is generated and stored
     4. Extracted features are stored
     5. ai_processed flag is set to true
-    6. All data can be retrieved from database
+    6. All data can be retrieved through the persistence layer
+    
+    The database is replaced by a mock connection here; the real Postgres
+    round trip is covered once by test_persistence_integration.
     """
-    # Skip if resume text is too short (invalid input)
-    assume(len(resume_text.strip()) >= 100)
-    assume(len(job_desc.strip()) >= 50)
+    # Generate application ID plus dummy job and applicant IDs
+    application_id, job_id, applicant_id = _random_uuids(3)
     
-    # Initialize ranker
-    ranker = EnhancedResumeRanker()
+    result = _process_resume(ranker, resume_text, job_desc)
     
-    # Generate application ID
-    application_id = str(uuid.uuid4())
+    # Verify processing succeeded
+    assert result['success'] is True, "Resume processing should succeed"
     
-    try:
-        # Process the resume
-        # Instead of using process_application which expects a URL,
-        # we'll directly test the core functionality
-        
-        # Extract features
-        features = ranker._extract_features(resume_text)
-        
-        # Generate summary
-        summary = ranker.generate_summary(resume_text, max_length=200)
-        
-        # Compute fit score
-        fit_score = ranker._compute_fit_score(resume_text, job_desc, features)
-        
-        # Build result object (simulating what process_application returns)
-        result = {
-            'success': True,
-            'fit_score': round(fit_score, 2),
-            'summary': summary,
-            'extracted_features': features
-        }
-        
-        # Verify processing succeeded
-        assert result['success'] is True, "Resume processing should succeed"
-        
-        # Verify fit_score is present and valid
-        assert 'fit_score' in result, "Result should contain fit_score"
-        assert isinstance(result['fit_score'], (int, float)), "fit_score should be numeric"
-        assert 0 <= result['fit_score'] <= 100, f"fit_score should be 0-100, got {result['fit_score']}"
-        
-        # Verify summary is present and non-empty
-        assert 'summary' in result, "Result should contain summary"
-        assert isinstance(result['summary'], str), "summary should be a string"
-        assert len(result['summary']) > 0, "summary should not be empty"
-        
-        # Verify extracted features are present
-        assert 'extracted_features' in result, "Result should contain extracted_features"
-        features = result['extracted_features']
-        
-        assert 'skills' in features, "Features should contain skills"
-        assert isinstance(features['skills'], list), "skills should be a list"
-        
-        assert 'years_experience' in features, "Features should contain years_experience"
-        assert isinstance(features['years_experience'], int), "years_experience should be an integer"
-        assert features['years_experience'] >= 0, "years_experience should be non-negative"
-        
-        assert 'project_count' in features, "Features should contain project_count"
-        assert isinstance(features['project_count'], int), "project_count should be an integer"
-        assert features['project_count'] >= 0, "project_count should be non-negative"
-        
-        assert 'education_score' in features, "Features should contain education_score"
-        assert isinstance(features['education_score'], int), "education_score should be an integer"
-        assert 0 <= features['education_score'] <= 5, "education_score should be 0-5"
-        
-        # Database round-trip test (if database is available)
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            # Insert application record (simulating what the backend would do)
-            cursor.execute("""
-                INSERT INTO applications (
-                    id, job_id, applicant_id, fit_score, summary, 
-                    shortlist_status, ai_processed
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO UPDATE SET
-                    fit_score = EXCLUDED.fit_score,
-                    summary = EXCLUDED.summary,
-                    ai_processed = EXCLUDED.ai_processed
-            """, (
-                application_id,
-                str(uuid.uuid4()),  # dummy job_id
-                str(uuid.uuid4()),  # dummy applicant_id
-                result['fit_score'],
-                result['summary'],
-                'pending',
-                True  # ai_processed flag
-            ))
-            
-            conn.commit()
-            
-            # Retrieve from database to verify round trip
-            cursor.execute("""
-                SELECT fit_score, summary, ai_processed
-                FROM applications
-                WHERE id = %s
-            """, (application_id,))
-            
-            row = cursor.fetchone()
-            assert row is not None, "Application should be retrievable from database"
-            
-            db_fit_score, db_summary, db_ai_processed = row
-            
-            # Verify retrieved data matches processed data
-            assert abs(db_fit_score - result['fit_score']) < 0.01, \
-                f"Retrieved fit_score {db_fit_score} should match processed {result['fit_score']}"
-            assert db_summary == result['summary'], "Retrieved summary should match processed summary"
-            assert db_ai_processed is True, "ai_processed flag should be True"
-            
-            # Clean up test data
-            cursor.execute("DELETE FROM applications WHERE id = %s", (application_id,))
-            conn.commit()
-            
-            cursor.close()
-            conn.close()
-            
-            logger.info(f"✓ Round trip test passed for application {application_id[:8]}...")
-            
-        except psycopg2.Error as db_error:
-            # Database not available or table doesn't exist - skip DB verification
-            logger.warning(f"Database verification skipped: {str(db_error)}")
-            # Still pass the test if processing worked correctly
-            pass
-        
-    except Exception as e:
-        # Log the error but don't fail the test if it's just a database issue
-        logger.error(f"Test error: {str(e)}")
-        raise
+    # Verify fit_score is present and valid
+    assert 'fit_score' in result, "Result should contain fit_score"
+    assert isinstance(result['fit_score'], (int, float)), "fit_score should be numeric"
+    assert 0 <= result['fit_score'] <= 100, f"fit_score should be 0-100, got {result['fit_score']}"
+    
+    # Verify summary is present and non-empty
+    assert 'summary' in result, "Result should contain summary"
+    assert isinstance(result['summary'], str), "summary should be a string"
+    assert len(result['summary']) > 0, "summary should not be empty"
+    
+    # Verify extracted features are present
+    assert 'extracted_features' in result, "Result should contain extracted_features"
+    features = result['extracted_features']
+    
+    assert 'skills' in features, "Features should contain skills"
+    assert isinstance(features['skills'], list), "skills should be a list"
+    
+    assert 'years_experience' in features, "Features should contain years_experience"
+    assert isinstance(features['years_experience'], int), "years_experience should be an integer"
+    assert features['years_experience'] >= 0, "years_experience should be non-negative"
+    
+    assert 'project_count' in features, "Features should contain project_count"
+    assert isinstance(features['project_count'], int), "project_count should be an integer"
+    assert features['project_count'] >= 0, "project_count should be non-negative"
+    
+    assert 'education_score' in features, "Features should contain education_score"
+    assert isinstance(features['education_score'], int), "education_score should be an integer"
+    assert 0 <= features['education_score'] <= 5, "education_score should be 0-5"
+    
+    # Persistence round trip against a mock connection
+    row = _persist_and_fetch(_mock_db_connection(), application_id, result, job_id, applicant_id)
+    _assert_round_trip(row, result)
 
-# Run the test if executed directly
-if __name__ == '__main__':
-    print("=" * 70)
-    print("Property-Based Test: Resume Processing Round Trip")
-    print("=" * 70)
-    print("\nThis test validates Requirements 1.1, 1.5, 1.6")
-    print("Running 10 iterations with randomly generated resume data...\n")
+INTEGRATION_RESUME = """
+Jane Smith
+Backend Engineer
+
+Professional Summary:
+Experienced backend engineer with 6 years of expertise in software development.
+Specialized in building scalable applications using Python, PostgreSQL and AWS.
+
+Education:
+Master of Science in Computer Science
+"""
+
+INTEGRATION_JOB_DESC = """
+We are looking for a Backend Engineer with strong experience in Python, AWS and PostgreSQL.
+The ideal candidate should have 4+ years of experience building scalable web applications.
+"""
+
+@pytest.fixture(scope="session")
+def db_connection():
+    """
+    One database connection per test session (one per worker under pytest-xdist),
+    or None when no database with an applications table is reachable.
+    """
+    if not setup_test_database():
+        yield None
+        return
     
-    # Check database availability
-    db_available = setup_test_database()
-    if db_available:
-        print("✓ Database connection successful - full round trip testing enabled")
-    else:
-        print("⚠ Database not available - testing processing logic only")
+    conn = get_db_connection()
+    yield conn
+    conn.close()
+
+@pytest.mark.integration
+def test_persistence_integration(ranker, db_connection):
+    """
+    **Validates: Requirements 1.5, 1.6**
     
-    print("\nStarting property tests...\n")
+    Single real Postgres round trip for a processed resume. Skipped when no
+    database with an applications table is reachable.
+    """
+    if db_connection is None:
+        pytest.skip("Database not available")
     
-    try:
-        # Run the property test
-        test_resume_processing_round_trip()
-        
-        print("\n" + "=" * 70)
-        print("✓ ALL PROPERTY TESTS PASSED")
-        print("=" * 70)
-        print("\nProperty 1: Resume Processing Round Trip - VERIFIED")
-        print("  - Resume processing succeeds for all valid inputs")
-        print("  - fit_score is computed and in valid range (0-100)")
-        print("  - Summary is generated and non-empty")
-        print("  - All features are extracted correctly")
-        print("  - Data can be stored and retrieved from database")
-        print("  - ai_processed flag is set to true")
-        print("\n✓ Requirements 1.1, 1.5, 1.6 validated successfully")
-        
-    except Exception as e:
-        print("\n" + "=" * 70)
-        print("✗ PROPERTY TEST FAILED")
-        print("=" * 70)
-        print(f"\nError: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    result = _process_resume(ranker, INTEGRATION_RESUME, INTEGRATION_JOB_DESC)
+    
+    application_id, job_id, applicant_id = _random_uuids(3)
+    row = _persist_and_fetch(db_connection, application_id, result, job_id, applicant_id)
+    
+    _assert_round_trip(row, result)
+    logger.info(f"✓ Round trip test passed for application {application_id[:8]}...")
+
+# Run the tests through pytest if executed directly, so conftest fixtures,
+# Hypothesis profiles and plugins such as pytest-xdist all apply
+if __name__ == '__main__':
+    raise SystemExit(pytest.main([__file__, "-q", "--no-header"]))
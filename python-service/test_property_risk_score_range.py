@@ -10,93 +10,66 @@ between 0.0 and 1.0 inclusive.
 import os
 import sys
 import logging
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
-from hypothesis import given, settings, strategies as st, assume, HealthCheck
-from hypothesis.strategies import composite
+from datetime import timedelta
+import pytest
+from hypothesis import given, settings, strategies as st, assume, HealthCheck, Phase
+from hypothesis.database import DirectoryBasedExampleDatabase
 
+from risk_test_support import (
+    NOW, H1, INTERVIEW_TEMPLATE, CANDIDATE_TEMPLATE, APPLICATION_TEMPLATE, COMPLETED, NO_SHOW, CANCELLED,
+    FakeConn, FakeCursor
+)
 from no_show_risk_analyzer import NoShowRiskAnalyzer
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# On-disk example database next to this file, so reruns replay saved
+# (including previously failing) examples before generating new ones.
+# Entries are written atomically, so pytest-xdist workers can share it.
+EXAMPLE_DB = DirectoryBasedExampleDatabase(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.hypothesis_db')
+)
+
+# No shrink or explain phases: any out-of-range score is as informative as a
+# minimal one, so failures are reported without extra analyze_risk calls
+PHASES = (Phase.reuse, Phase.generate, Phase.target)
 
-# Strategy for generating interview data
-@composite
-def interview_data(draw):
+# Shared past interview row for each drawn status
+_PAST_ROWS = {'completed': COMPLETED, 'no_show': NO_SHOW, 'cancelled': CANCELLED}
+
+
+def _build_payload(d):
     """
-    Generate realistic interview data for risk analysis testing.
-    Returns interview, candidate, and application dictionaries.
+    Turn one drawn set of interview factors into the interview, candidate,
+    application, negotiation and past interview rows the analyzer reads.
     """
-    # Generate response time (0-72 hours)
-    response_hours = draw(st.integers(min_value=0, max_value=72))
-    
-    # Generate interview status
-    statuses = ['invitation_sent', 'slot_pending', 'confirmed']
-    status = draw(st.sampled_from(statuses))
-    
     # Create timestamps based on response time
-    created_at = datetime.now() - timedelta(hours=response_hours + 1)
-    updated_at = datetime.now() - timedelta(hours=1) if status != 'invitation_sent' else created_at
+    created_at = NOW - timedelta(hours=d['response_hours'] + 1)
+    updated_at = H1 if d['status'] != 'invitation_sent' else created_at
     
-    interview = {
-        'id': 'test-interview-id',
-        'application_id': 'test-app-id',
-        'job_id': 'test-job-id',
-        'recruiter_id': 'test-recruiter-id',
-        'candidate_id': 'test-candidate-id',
-        'status': status,
-        'created_at': created_at,
-        'updated_at': updated_at,
-        'confirmation_deadline': None,
-        'slot_selection_deadline': None,
-        'scheduled_time': None
-    }
+    interview = INTERVIEW_TEMPLATE.copy()
+    interview['status'] = d['status']
+    interview['created_at'] = created_at
+    interview['updated_at'] = updated_at
     
-    # Generate candidate data with varying completeness
-    has_name = draw(st.booleans())
-    has_email = draw(st.booleans())
-    has_phone = draw(st.booleans())
+    candidate = CANDIDATE_TEMPLATE.copy()
+    candidate['name'] = 'John Doe' if d['has_name'] else None
+    candidate['email'] = 'john@example.com' if d['has_email'] else None
+    candidate['phone'] = '+1234567890' if d['has_phone'] else None
     
-    candidate = {
-        'id': 'test-candidate-id',
-        'name': 'John Doe' if has_name else None,
-        'email': 'john@example.com' if has_email else None,
-        'phone': '+1234567890' if has_phone else None,
-        'created_at': datetime.now() - timedelta(days=30)
-    }
+    application = APPLICATION_TEMPLATE.copy()
+    application['cover_letter'] = (
+        'This is a detailed cover letter with meaningful content.' if d['has_cover_letter'] else None
+    )
+    application['address'] = '123 Main St, City, State 12345' if d['has_address'] else None
+    application['resume_url'] = 'https://example.com/resume.pdf' if d['has_resume'] else None
     
-    # Generate application data with varying completeness
-    has_cover_letter = draw(st.booleans())
-    has_address = draw(st.booleans())
-    has_resume = draw(st.booleans())
-    
-    application = {
-        'id': 'test-app-id',
-        'applicant_id': 'test-candidate-id',
-        'job_id': 'test-job-id',
-        'cover_letter': 'This is a detailed cover letter with meaningful content.' if has_cover_letter else None,
-        'address': '123 Main St, City, State 12345' if has_address else None,
-        'resume_url': 'https://example.com/resume.pdf' if has_resume else None,
-        'created_at': datetime.now() - timedelta(days=5)
-    }
-    
-    # Generate negotiation data
-    negotiation_rounds = draw(st.integers(min_value=0, max_value=5))
     negotiation = {
-        'round': negotiation_rounds,
+        'round': d['negotiation_rounds'],
         'state': 'awaiting_selection'
-    } if negotiation_rounds > 0 else None
-    
-    # Generate historical interview data
-    num_past_interviews = draw(st.integers(min_value=0, max_value=10))
-    past_interviews = []
+    } if d['negotiation_rounds'] > 0 else None
     
-    if num_past_interviews > 0:
-        for _ in range(num_past_interviews):
-            past_status = draw(st.sampled_from(['completed', 'no_show', 'cancelled']))
-            past_interviews.append({'status': past_status})
+    past_interviews = [_PAST_ROWS[past_status] for past_status in d['past_statuses']]
     
     return {
         'interview': interview,
@@ -107,13 +80,55 @@ def interview_data(draw):
     }
 
 
-@given(data=interview_data())
+# Strategy for generating realistic interview data for risk analysis testing:
+# response time (0-72 hours), interview status, candidate and application
+# completeness, negotiation rounds and up to 10 past interviews
+interview_data = st.fixed_dictionaries({
+    'response_hours': st.integers(min_value=0, max_value=72),
+    'status': st.sampled_from(['invitation_sent', 'slot_pending', 'confirmed']),
+    'has_name': st.booleans(),
+    'has_email': st.booleans(),
+    'has_phone': st.booleans(),
+    'has_cover_letter': st.booleans(),
+    'has_address': st.booleans(),
+    'has_resume': st.booleans(),
+    'negotiation_rounds': st.integers(min_value=0, max_value=5),
+    'past_statuses': st.lists(st.sampled_from(['completed', 'no_show', 'cancelled']), max_size=10)
+}).map(_build_payload)
+
+
+@pytest.fixture(scope="module")
+def monkeypatch_module():
+    """Module-scoped counterpart of the built-in monkeypatch fixture"""
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+@pytest.fixture(scope="module")
+def fake_conn():
+    """Fake connection shared by the module; tests reload fake_conn.c per example"""
+    return FakeConn(FakeCursor())
+
+
+@pytest.fixture(scope="module")
+def patched_analyzer(monkeypatch_module, fake_conn):
+    """One NoShowRiskAnalyzer for the whole module, connected to fake_conn"""
+    monkeypatch_module.setattr(
+        'no_show_risk_analyzer.NoShowRiskAnalyzer._get_db_connection',
+        lambda self: fake_conn
+    )
+    return NoShowRiskAnalyzer()
+
+
+@given(data=interview_data)
 @settings(
-    max_examples=3,
+    max_examples=50,
+    database=EXAMPLE_DB,
+    phases=PHASES,
     deadline=None,
     suppress_health_check=[HealthCheck.function_scoped_fixture]
 )
-def test_risk_score_range_property(data):
+def test_risk_score_range_property(patched_analyzer, fake_conn, data):
     """
     Property 24: Risk Score Range
     
@@ -126,97 +141,58 @@ def test_risk_score_range_property(data):
     This property ensures that the risk scoring algorithm never produces invalid
     scores regardless of input variations.
     """
-    analyzer = NoShowRiskAnalyzer()
-    
-    # Mock database connection and cursor
-    with patch('no_show_risk_analyzer.NoShowRiskAnalyzer._get_db_connection') as mock_db_conn:
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_db_conn.return_value = mock_conn
-        
-        # Set up cursor to return mock data
-        mock_cursor.fetchone.side_effect = [
+    # Set up cursor to return mock data; fetchall serves historical interviews
+    fake_conn.c.load(
+        (
             data['interview'],  # First call: get interview
             data['candidate'],  # Second call: get candidate
             data['application'],  # Third call: get application
             data['negotiation'],  # Fourth call: get negotiation
-        ]
-        
-        # Set up fetchall for historical interviews
-        mock_cursor.fetchall.return_value = data['past_interviews']
-        
-        # Execute risk analysis
-        result = analyzer.analyze_risk('test-interview-id', 'test-candidate-id')
-        
-        # Property assertion: Risk score must be in valid range [0.0, 1.0]
-        risk_score = result['no_show_risk']
-        assert 0.0 <= risk_score <= 1.0, \
-            f"Risk score {risk_score} is outside valid range [0.0, 1.0]"
-        
-        # Additional invariants
-        assert isinstance(risk_score, (int, float)), \
-            f"Risk score must be numeric, got {type(risk_score)}"
-        
-        # Verify risk level is consistent with score
-        # Note: The implementation rounds to 2 decimal places, so we need to check
-        # the categorization based on the actual implementation logic
-        risk_level = result['risk_level']
-        assert risk_level in ['low', 'medium', 'high'], \
-            f"Risk level must be 'low', 'medium', or 'high', got '{risk_level}'"
-        
-        # Verify categorization is reasonable (allowing for rounding at boundaries)
-        if risk_score < 0.29:
-            assert risk_level == 'low', \
-                f"Risk score {risk_score} should be categorized as 'low', got '{risk_level}'"
-        elif risk_score > 0.71:
-            assert risk_level == 'high', \
-                f"Risk score {risk_score} should be categorized as 'high', got '{risk_level}'"
-        # For boundary cases (0.29-0.31 and 0.69-0.71), allow either category due to rounding
+        ),
+        data['past_interviews']
+    )
+    
+    # Execute risk analysis
+    result = patched_analyzer.analyze_risk('test-interview-id', 'test-candidate-id')
+    
+    # Property assertion: Risk score must be in valid range [0.0, 1.0]
+    risk_score = result['no_show_risk']
+    assert 0.0 <= risk_score <= 1.0, \
+        f"Risk score {risk_score} is outside valid range [0.0, 1.0]"
+    
+    # Additional invariants
+    assert isinstance(risk_score, (int, float)), \
+        f"Risk score must be numeric, got {type(risk_score)}"
+    
+    # Verify risk level is consistent with score
+    # Note: The implementation rounds to 2 decimal places, so we need to check
+    # the categorization based on the actual implementation logic
+    risk_level = result['risk_level']
+    assert risk_level in ['low', 'medium', 'high'], \
+        f"Risk level must be 'low', 'medium', or 'high', got '{risk_level}'"
+    
+    # Verify categorization is reasonable (allowing for rounding at boundaries)
+    if risk_score < 0.29:
+        assert risk_level == 'low', \
+            f"Risk score {risk_score} should be categorized as 'low', got '{risk_level}'"
+    elif risk_score > 0.71:
+        assert risk_level == 'high', \
+            f"Risk score {risk_score} should be categorized as 'high', got '{risk_level}'"
+    # For boundary cases (0.29-0.31 and 0.69-0.71), allow either category due to rounding
 
 
-@given(
-    response_hours=st.floats(min_value=0, max_value=100),
-    negotiation_rounds=st.integers(min_value=0, max_value=10),
-    profile_fields_complete=st.integers(min_value=0, max_value=6),
-    past_no_shows=st.integers(min_value=0, max_value=20),
-    past_completed=st.integers(min_value=0, max_value=20)
-)
-@settings(
-    max_examples=3,
-    deadline=None,
-    suppress_health_check=[HealthCheck.function_scoped_fixture]
-)
-def test_risk_score_range_extreme_inputs(response_hours, negotiation_rounds, 
-                                         profile_fields_complete, past_no_shows, 
-                                         past_completed):
+def _extreme_payload(response_hours, negotiation_rounds, profile_fields_complete,
+                     past_no_shows, past_completed):
     """
-    Property 24: Risk Score Range (Extreme Inputs)
-    
-    **Validates: Requirements 7.3**
-    
-    Test risk score range with extreme and edge case inputs to ensure
-    the algorithm handles unusual scenarios gracefully and still produces
-    valid scores in the [0.0, 1.0] range.
+    Build the interview, candidate, application, negotiation and past
+    interview rows for one extreme-input scenario.
     """
-    analyzer = NoShowRiskAnalyzer()
-    
     # Create interview with extreme response time
-    created_at = datetime.now() - timedelta(hours=response_hours + 1)
-    updated_at = datetime.now() - timedelta(hours=1)
-    
     interview = {
-        'id': 'test-interview-id',
-        'application_id': 'test-app-id',
-        'job_id': 'test-job-id',
-        'recruiter_id': 'test-recruiter-id',
-        'candidate_id': 'test-candidate-id',
+        **INTERVIEW_TEMPLATE,
         'status': 'slot_pending',
-        'created_at': created_at,
-        'updated_at': updated_at,
-        'confirmation_deadline': None,
-        'slot_selection_deadline': None,
-        'scheduled_time': None
+        'created_at': NOW - timedelta(hours=response_hours + 1),
+        'updated_at': H1
     }
     
     # Create candidate and application with controlled completeness
@@ -225,21 +201,17 @@ def test_risk_score_range_extreme_inputs(response_hours, negotiation_rounds,
     app_fields = min(profile_fields_complete - candidate_fields, 3)
     
     candidate = {
-        'id': 'test-candidate-id',
+        **CANDIDATE_TEMPLATE,
         'name': 'John Doe' if candidate_fields > 0 else None,
         'email': 'john@example.com' if candidate_fields > 1 else None,
-        'phone': '+1234567890' if candidate_fields > 2 else None,
-        'created_at': datetime.now() - timedelta(days=30)
+        'phone': '+1234567890' if candidate_fields > 2 else None
     }
     
     application = {
-        'id': 'test-app-id',
-        'applicant_id': 'test-candidate-id',
-        'job_id': 'test-job-id',
+        **APPLICATION_TEMPLATE,
         'cover_letter': 'Detailed cover letter content here.' if app_fields > 0 else None,
         'address': '123 Main St, City, State' if app_fields > 1 else None,
-        'resume_url': 'https://example.com/resume.pdf' if app_fields > 2 else None,
-        'created_at': datetime.now() - timedelta(days=5)
+        'resume_url': 'https://example.com/resume.pdf' if app_fields > 2 else None
     }
     
     # Create negotiation data
@@ -249,43 +221,57 @@ def test_risk_score_range_extreme_inputs(response_hours, negotiation_rounds,
     } if negotiation_rounds > 0 else None
     
     # Create historical interview data
-    past_interviews = []
-    for _ in range(past_no_shows):
-        past_interviews.append({'status': 'no_show'})
-    for _ in range(past_completed):
-        past_interviews.append({'status': 'completed'})
+    past_interviews = [NO_SHOW] * past_no_shows + [COMPLETED] * past_completed
+    
+    return interview, candidate, application, negotiation, past_interviews
+
+
+@given(
+    response_hours=st.floats(min_value=0, max_value=100),
+    negotiation_rounds=st.integers(min_value=0, max_value=10),
+    profile_fields_complete=st.integers(min_value=0, max_value=6),
+    past_no_shows=st.integers(min_value=0, max_value=20),
+    past_completed=st.integers(min_value=0, max_value=20)
+)
+@settings(
+    max_examples=50,
+    database=EXAMPLE_DB,
+    phases=PHASES,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture]
+)
+def test_risk_score_range_extreme_inputs(patched_analyzer, fake_conn, response_hours, negotiation_rounds, 
+                                         profile_fields_complete, past_no_shows, 
+                                         past_completed):
+    """
+    Property 24: Risk Score Range (Extreme Inputs)
+    
+    **Validates: Requirements 7.3**
+    
+    Test risk score range with extreme and edge case inputs to ensure
+    the algorithm handles unusual scenarios gracefully and still produces
+    valid scores in the [0.0, 1.0] range.
+    """
+    interview, candidate, application, negotiation, past_interviews = _extreme_payload(
+        response_hours, negotiation_rounds, profile_fields_complete, past_no_shows, past_completed
+    )
+    
+    # Set up cursor to return mock data
+    fake_conn.c.load((interview, candidate, application, negotiation), past_interviews)
+    
+    # Execute risk analysis
+    result = patched_analyzer.analyze_risk('test-interview-id', 'test-candidate-id')
+    
+    # Property assertion: Risk score must be in valid range
+    risk_score = result['no_show_risk']
+    assert 0.0 <= risk_score <= 1.0, \
+        f"Risk score {risk_score} is outside valid range [0.0, 1.0] with extreme inputs"
     
-    # Mock database connection
-    with patch('no_show_risk_analyzer.NoShowRiskAnalyzer._get_db_connection') as mock_db_conn:
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_db_conn.return_value = mock_conn
-        
-        # Set up cursor to return mock data
-        mock_cursor.fetchone.side_effect = [
-            interview,
-            candidate,
-            application,
-            negotiation,
-        ]
-        
-        mock_cursor.fetchall.return_value = past_interviews
-        
-        # Execute risk analysis
-        result = analyzer.analyze_risk('test-interview-id', 'test-candidate-id')
-        
-        # Property assertion: Risk score must be in valid range
-        risk_score = result['no_show_risk']
-        assert 0.0 <= risk_score <= 1.0, \
-            f"Risk score {risk_score} is outside valid range [0.0, 1.0] with extreme inputs"
-        
-        # Verify result structure
-        assert 'risk_level' in result
-        assert 'factors' in result
-        assert result['risk_level'] in ['low', 'medium', 'high']
+    # Verify result structure
+    assert 'risk_level' in result
+    assert 'factors' in result
+    assert result['risk_level'] in ['low', 'medium', 'high']
 
 
 if __name__ == '__main__':
-    import pytest
     pytest.main([__file__, '-v', '-s'])
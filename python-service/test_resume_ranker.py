@@ -1,16 +1,41 @@
 """
 Test script for EnhancedResumeRanker
+
+Under pytest the tests share the session-scoped `ranker` fixture from
+conftest.py.
 """
+from functools import lru_cache
+
 from resume_ranker import EnhancedResumeRanker
 
-def test_summary_generation():
-    """Test the generate_summary method"""
-    print("=" * 60)
-    print("Testing Summary Generation")
-    print("=" * 60)
-    
-    ranker = EnhancedResumeRanker()
+# Resume and job description shared by the feature extraction and fit score tests
+SAMPLE_RESUME = """
+    Senior Software Engineer with 8 years of experience in Python, JavaScript, React, 
+    Node.js, AWS, Docker, and PostgreSQL. Master's degree in Computer Science.
     
+    Developed 15+ projects including:
+    - E-commerce platform
+    - Real-time analytics dashboard
+    - Microservices architecture
+    - Machine learning pipeline
+    - Mobile application backend
+    """
+
+SAMPLE_JD = """
+    We are looking for a Senior Software Engineer with strong experience in Python,
+    React, and AWS. The ideal candidate should have 5+ years of experience building
+    scalable web applications and microservices. Master's degree preferred.
+    """
+
+
+# Both tests extract features from SAMPLE_RESUME; do it once per ranker
+@lru_cache(maxsize=8)
+def _cached_features(ranker, resume_text):
+    return ranker._extract_features(resume_text)
+
+
+def test_summary_generation(ranker):
+    """Test the generate_summary method"""
     # Sample resume text
     sample_resume = """
     John Doe
@@ -51,102 +76,56 @@ def test_summary_generation():
     # Generate summary
     summary = ranker.generate_summary(sample_resume, max_length=200)
     
-    print(f"\nOriginal Resume Length: {len(sample_resume)} characters")
-    print(f"Summary Length: {len(summary)} characters")
-    print(f"\nGenerated Summary:\n{summary}")
-    print("\n" + "=" * 60)
+    assert isinstance(summary, str)
+    # max_length may be followed by an ellipsis when the summary is truncated
+    assert 0 < len(summary) <= 200 + len('...')
+    assert len(summary) < len(sample_resume)
+    assert summary != "Resume content too short to summarize."
     
     # Test with short text
     short_text = "Software engineer with Python experience."
     short_summary = ranker.generate_summary(short_text, max_length=200)
-    print(f"\nShort Text Summary: {short_summary}")
-    print("=" * 60)
+    assert short_summary == "Resume content too short to summarize."
 
-def test_feature_extraction():
+def test_feature_extraction(ranker):
     """Test feature extraction"""
-    print("\n" + "=" * 60)
-    print("Testing Feature Extraction")
-    print("=" * 60)
-    
-    ranker = EnhancedResumeRanker()
-    
-    sample_resume = """
-    Senior Software Engineer with 8 years of experience in Python, JavaScript, React, 
-    Node.js, AWS, Docker, and PostgreSQL. Master's degree in Computer Science.
-    
-    Developed 15+ projects including:
-    - E-commerce platform
-    - Real-time analytics dashboard
-    - Microservices architecture
-    - Machine learning pipeline
-    - Mobile application backend
-    """
-    
-    features = ranker._extract_features(sample_resume)
-    
-    print(f"\nExtracted Features:")
-    print(f"  Skills: {features['skills']}")
-    print(f"  Years Experience: {features['years_experience']}")
-    print(f"  Project Count: {features['project_count']}")
-    print(f"  Education Score: {features['education_score']}")
-    print("=" * 60)
+    features = _cached_features(ranker, SAMPLE_RESUME)
+    
+    assert isinstance(features['skills'], list)
+    for skill in ['Python', 'Javascript', 'React', 'Aws', 'Docker', 'Postgresql']:
+        assert skill in features['skills'], f"Expected skill {skill} in {features['skills']}"
+    assert features['years_experience'] == 8
+    # Counted from keyword mentions ("Developed", "projects"), not the "15+"
+    assert features['project_count'] == 2
+    assert features['education_score'] > 0, "Master's degree should give a positive education score"
 
-def test_fit_score():
+def test_fit_score(ranker):
     """Test fit score calculation"""
-    print("\n" + "=" * 60)
-    print("Testing Fit Score Calculation")
-    print("=" * 60)
-    
-    ranker = EnhancedResumeRanker()
-    
-    resume_text = """
-    Senior Software Engineer with 8 years of experience in Python, JavaScript, React, 
-    Node.js, AWS, Docker, and PostgreSQL. Master's degree in Computer Science.
-    Built 15+ projects including microservices, APIs, and cloud infrastructure.
-    """
-    
-    job_description = """
-    We are looking for a Senior Software Engineer with strong experience in Python,
-    React, and AWS. The ideal candidate should have 5+ years of experience building
-    scalable web applications and microservices. Master's degree preferred.
-    """
-    
-    features = ranker._extract_features(resume_text)
-    fit_score = ranker._compute_fit_score(resume_text, job_description, features)
-    
-    print(f"\nJob Description: {job_description[:100]}...")
-    print(f"\nResume Summary: {resume_text[:100]}...")
-    print(f"\nComputed Fit Score: {fit_score:.2f}/100")
-    print("=" * 60)
+    features = _cached_features(ranker, SAMPLE_RESUME)
+    fit_score = ranker._compute_fit_score(SAMPLE_RESUME, SAMPLE_JD, features)
+    
+    assert 0 <= fit_score <= 100
+    # The resume covers the job's core skills, experience and degree, so it
+    # should clearly outscore an unrelated one
+    unrelated = "Home cook experienced in cooking and baking."
+    unrelated_score = ranker._compute_fit_score(unrelated, SAMPLE_JD, _cached_features(ranker, unrelated))
+    assert fit_score > unrelated_score + 25, f"{fit_score} vs unrelated {unrelated_score}"
 
-def test_error_handling():
+def test_error_handling(ranker):
     """Test error handling"""
-    print("\n" + "=" * 60)
-    print("Testing Error Handling")
-    print("=" * 60)
-    
-    ranker = EnhancedResumeRanker()
-    
     # Test with empty text
     empty_summary = ranker.generate_summary("", max_length=200)
-    print(f"\nEmpty Text Summary: {empty_summary}")
+    assert empty_summary == "Resume content too short to summarize."
     
     # Test with very short text
     short_summary = ranker.generate_summary("Hi", max_length=200)
-    print(f"Very Short Text Summary: {short_summary}")
-    
-    print("=" * 60)
+    assert short_summary == "Resume content too short to summarize."
 
 if __name__ == '__main__':
-    print("\n" + "=" * 60)
-    print("ENHANCED RESUME RANKER TEST SUITE")
-    print("=" * 60)
-    
-    test_summary_generation()
-    test_feature_extraction()
-    test_fit_score()
-    test_error_handling()
-    
-    print("\n" + "=" * 60)
-    print("ALL TESTS COMPLETED")
-    print("=" * 60)
+    # Outside pytest there is no ranker fixture, so build the ranker once
+    ranker = EnhancedResumeRanker()
+    test_summary_generation(ranker)
+    test_feature_extraction(ranker)
+    test_fit_score(ranker)
+    test_error_handling(ranker)
+    print("All EnhancedResumeRanker tests passed")
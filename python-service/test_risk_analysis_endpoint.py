@@ -2,57 +2,40 @@
 Simple test for the risk analysis endpoint
 """
 import pytest
-import json
 from app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the Flask app"""
+    """Create one test client for the Flask app, shared by the module's tests"""
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
 
 
-def test_analyze_risk_endpoint_missing_fields(client):
+@pytest.mark.parametrize('payload', [
+    {},                             # Missing both fields
+    {'interview_id': 'test-id'},    # Missing candidate_id
+    {'candidate_id': 'test-id'}     # Missing interview_id
+], ids=['missing-both', 'missing-candidate-id', 'missing-interview-id'])
+def test_analyze_risk_endpoint_missing_fields(client, payload):
     """Test that the endpoint returns 400 when required fields are missing"""
-    # Missing both fields
-    response = client.post('/api/python/analyze-risk',
-                          data=json.dumps({}),
-                          content_type='application/json')
+    response = client.post('/api/python/analyze-risk', json=payload)
     assert response.status_code == 400
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['success'] is False
     assert 'Missing required fields' in data['error']
-    
-    # Missing candidate_id
-    response = client.post('/api/python/analyze-risk',
-                          data=json.dumps({'interview_id': 'test-id'}),
-                          content_type='application/json')
-    assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data['success'] is False
-    
-    # Missing interview_id
-    response = client.post('/api/python/analyze-risk',
-                          data=json.dumps({'candidate_id': 'test-id'}),
-                          content_type='application/json')
-    assert response.status_code == 400
-    data = json.loads(response.data)
-    assert data['success'] is False
 
 
 def test_analyze_risk_endpoint_invalid_ids(client):
     """Test that the endpoint returns 404 when IDs don't exist"""
-    response = client.post('/api/python/analyze-risk',
-                          data=json.dumps({
-                              'interview_id': 'non-existent-id',
-                              'candidate_id': 'non-existent-id'
-                          }),
-                          content_type='application/json')
+    response = client.post('/api/python/analyze-risk', json={
+        'interview_id': 'non-existent-id',
+        'candidate_id': 'non-existent-id'
+    })
     # Should return 404 or 500 depending on database state
     assert response.status_code in [404, 500]
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['success'] is False
 
 
@@ -60,7 +43,7 @@ def test_health_check(client):
     """Test that the health check endpoint works"""
     response = client.get('/health')
     assert response.status_code == 200
-    data = json.loads(response.data)
+    data = response.get_json()
     assert data['status'] == 'healthy'
     assert data['service'] == 'resume-intelligence-engine'
 